@@ -1,16 +1,24 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import json
+import re
+import orjson
+import html
+import threading
+from collections import deque
+from itertools import chain
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.io as pio
 from datetime import datetime
 import logging
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, 
-                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Set page configuration
 st.set_page_config(
@@ -20,67 +28,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Define API URLs
-API_BASE_URL = "https://github-critic-fastapi.onrender.com/api"
-REPO_STRUCTURE_URL = f"{API_BASE_URL}/repositories/structure"
-AUTO_ROAST_URL = f"{API_BASE_URL}/repositories/auto-roast"
-DIRECTORY_EXPLORE_URL = f"{API_BASE_URL}/repositories/explore"
-DIRECTORY_SIZES_URL = f"{API_BASE_URL}/repositories/directory-sizes"
-
-# Display API settings at the top for debugging
-with st.sidebar:
-    st.write(f"API Base URL: {API_BASE_URL}")
-    if st.checkbox("Debug Mode"):
-        st.session_state.debug_mode = True
-    else:
-        st.session_state.debug_mode = False
-
-# Add custom CSS
-st.markdown("""
-<style>
+# Page-wide styles
+_PAGE_CSS = """
     .main .block-container {
         padding-top: 2rem;
     }
-    .stTabs [data-baseweb="tab-panel"] {
-        padding: 1rem 0;
-    }
-    .critique-box {
-        background-color: #f8f9fa;
-        border-radius: 5px;
-        padding: 20px;
-        margin-top: 10px;
-        border-left: 5px solid #6c757d;
-        color: #212529;
-    }
-    .brutal {
-        border-left: 5px solid #dc3545;
-    }
-    .constructive {
-        border-left: 5px solid #28a745;
-    }
-    .educational {
-        border-left: 5px solid #17a2b8;
-    }
-    .funny {
-        border-left: 5px solid #ffc107;
-    }
-    .security {
-        border-left: 5px solid #6f42c1;
-    }
-    .suggestion-box {
-        background-color: #e9f7ef;
-        border-radius: 5px;
-        padding: 20px;
-        margin-top: 10px;
-        border-left: 5px solid #28a745;
-    }
-    .summary-box {
-        background-color: #e2f0fb;
-        border-radius: 5px;
-        padding: 20px;
-        margin-top: 10px;
-        border-left: 5px solid #007bff;
-    }
     .stFileUploader > div > button {
         width: 100%;
     }
@@ -94,8 +46,109 @@ st.markdown("""
     .log-error {
         border-left: 5px solid #dc3545;
     }
-</style>
-""", unsafe_allow_html=True)
+    .log-body {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        gap: 10px;
+    }
+    .log-body pre {
+        white-space: pre-wrap;
+        max-height: 300px;
+        overflow: auto;
+    }
+    .log-error-message {
+        color: #dc3545;
+    }
+"""
+
+# The stylesheet has to be sent on every rerun (Streamlit drops elements a run doesn't emit),
+# so send it minified and only do the minifying once
+@st.cache_data(show_spinner=False)
+def _minify_css(css):
+    return re.sub(r"\s*([{}:;,>])\s*", r"\1", re.sub(r"\s+", " ", css)).strip()
+
+# Define API URLs
+API_BASE_URL = "https://github-critic-fastapi.onrender.com/api"
+REPO_STRUCTURE_URL = f"{API_BASE_URL}/repositories/structure"
+AUTO_ROAST_URL = f"{API_BASE_URL}/repositories/auto-roast"
+DIRECTORY_EXPLORE_URL = f"{API_BASE_URL}/repositories/explore"
+DIRECTORY_SIZES_URL = f"{API_BASE_URL}/repositories/directory-sizes"
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+# Backoff schedule shared by job registration and status polling, in seconds
+POLL_INITIAL_INTERVAL = 0.5
+POLL_BACKOFF_FACTOR = 1.5
+POLL_MAX_INTERVAL = 10.0
+REGISTRATION_DEADLINE = 40
+POLL_DEADLINE = 180
+
+# Status fields that only change when the backend makes progress; other fields such as
+# timestamps or elapsed time change on every poll and must not reset the backoff
+STATUS_PROGRESS_KEYS = ("processed_files", "processed_directories")
+
+# Upper bound on subdirectory listings prefetched for each listing shown
+MAX_PREFETCHED_PATHS = 16
+
+# Main content tabs, in display order
+TABS = ["Repository Info", "File Explorer", "Roast Results"]
+
+# Heading colour for each critique style
+STYLE_COLORS = {
+    "brutal": "red",
+    "constructive": "green",
+    "educational": "blue",
+    "funny": "orange",
+    "security": "violet"
+}
+
+# Language checkboxes in the Auto-Roast configuration: label -> (extensions, checked by default)
+EXTENSION_OPTIONS = {
+    "Python (.py)": ([".py"], True),
+    "JavaScript (.js, .jsx)": ([".js", ".jsx"], False),
+    "TypeScript (.ts, .tsx)": ([".ts", ".tsx"], False),
+    "Java (.java)": ([".java"], False)
+}
+
+# Shared HTTP session so every call to the API reuses pooled keep-alive connections
+def _make_session():
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                    raise_on_status=False)
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retries))
+    session.headers.update({
+        "User-Agent": "github-critic-streamlit",
+        "Accept": "application/json"
+    })
+    return session
+
+# One-time resources, created on the first run and reused by every rerun
+@st.cache_resource(show_spinner=False)
+def _bootstrap():
+    # Configure logging
+    logging.basicConfig(level=logging.INFO, 
+                       format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    return {
+        "logger": logging.getLogger(__name__),
+        "session": _make_session(),
+        # Shared worker pool for overlapping independent API calls
+        "executor": ThreadPoolExecutor(max_workers=4)
+    }
+
+_resources = _bootstrap()
+logger = _resources["logger"]
+SESSION = _resources["session"]
+EXECUTOR = _resources["executor"]
+
+# Display API settings at the top for debugging
+with st.sidebar:
+    st.write(f"API Base URL: {API_BASE_URL}")
+    if st.checkbox("Debug Mode"):
+        st.session_state.debug_mode = True
+    else:
+        st.session_state.debug_mode = False
+
+# Add custom CSS
+st.markdown(f"<style>{_minify_css(_PAGE_CSS)}</style>", unsafe_allow_html=True)
 
 # Title and description
 st.title("GitHub Critic - powered by EdenAI")
@@ -115,31 +168,101 @@ if 'roast_results' not in st.session_state:
 if 'current_path' not in st.session_state:
     st.session_state.current_path = ""
 if 'active_tab' not in st.session_state:
-    st.session_state.active_tab = 0
+    # Restore the active tab from the URL so deep links open the right view
+    tab_param = st.query_params.get("tab", "0")
+    st.session_state.active_tab = int(tab_param) if tab_param.isdigit() and int(tab_param) < len(TABS) else 0
 if 'directory_contents' not in st.session_state:
     st.session_state.directory_contents = None
 if 'debug_mode' not in st.session_state:
     st.session_state.debug_mode = False
+if 'explorer_nav' not in st.session_state:
+    st.session_state.explorer_nav = 0
+if 'prefetched_listing' not in st.session_state:
+    st.session_state.prefetched_listing = None
 if 'request_logs' not in st.session_state:
-    st.session_state.request_logs = []
+    st.session_state.request_logs = deque(maxlen=20)  # Keep only last 20 logs
+if 'worker_logs' not in st.session_state:
+    st.session_state.worker_logs = deque(maxlen=20)  # Bounded like request_logs between merges
+
+# Session state must only be touched on the script thread, so requests made by
+# prefetch workers append their log entries to the session's worker_logs deque instead
+_worker_log = threading.local()
 
 # Function to log API requests and responses
-def log_api_request(method, url, payload=None, response=None, error=None):
+def log_api_request(method, url, payload=None, response=None, error=None, parsed=None):
+    sink = getattr(_worker_log, "sink", None)
+    debug_mode = _worker_log.debug_mode if sink is not None else st.session_state.get("debug_mode")
+    
+    # Keep a minimal entry so recent requests still show up when Debug Mode is turned on later
     log_entry = {
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "method": method,
         "url": url,
-        "payload": payload,
-        "status_code": response.status_code if response else None,
-        "response": response.json() if response and response.ok else None,
+        "status_code": response.status_code if response is not None else None,
         "error": str(error) if error else None,
-        "response_text": response.text if response else None
+        "payload": None,
+        "response": None,
+        "response_text": None
     }
-    logger.info(f"API Request: {log_entry}")
-    st.session_state.request_logs.append(log_entry)
-    # Keep only last 20 logs
-    if len(st.session_state.request_logs) > 20:
-        st.session_state.request_logs = st.session_state.request_logs[-20:]
+    # Bodies are only rendered in Debug Mode
+    if debug_mode:
+        log_entry.update({
+            "payload": payload,
+            "response": parsed,
+            # Raw text is only shown for failed requests, so don't keep large successful bodies around
+            "response_text": response.text if (response is not None and not response.ok) else None
+        })
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"API Request: {log_entry}")
+    if sink is not None:
+        sink.append(log_entry)
+    else:
+        st.session_state.request_logs.append(log_entry)
+
+def merge_worker_logs():
+    """Move log entries queued by prefetch workers into the session's request log"""
+    while True:
+        try:
+            st.session_state.request_logs.append(st.session_state.worker_logs.popleft())
+        except IndexError:
+            break
+
+def _pre(text):
+    # Encode newlines so multi-line bodies stay inside the HTML block when parsed as markdown
+    escaped = html.escape(text).replace("\n", "&#10;")
+    return f"<pre>{escaped}</pre>"
+
+def render_log_entry(log):
+    """Render a request log entry as a single-line HTML block for the debug view"""
+    log_class = "log-entry"
+    if log.get('error') or (log.get('status_code') and log.get('status_code') >= 400):
+        log_class += " log-error"
+    
+    request_col = ""
+    if log['payload']:
+        request_col = "Request Payload:" + _pre(json.dumps(log['payload'], indent=2))
+    
+    response_col = ""
+    if log['response']:
+        response_col = "Response:" + _pre(json.dumps(log['response'], indent=2))
+    elif log['response_text']:
+        response_col = "Response Text:" + _pre(log['response_text'])
+    
+    error = f'<div class="log-error-message">{html.escape(log["error"])}</div>' if log['error'] else ""
+    
+    return (f'<div class="{log_class}">'
+            f'<strong>{log["timestamp"]}</strong> - {log["method"]} {html.escape(log["url"])}<br/>'
+            f'Status Code: {log["status_code"] or "N/A"}'
+            f'<div class="log-body"><div>{request_col}</div><div>{response_col}</div></div>'
+            f'{error}</div>')
+
+# JSON encoding/decoding for API traffic
+def _parse(response):
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        # Match response.json() so the helpers' RequestException handling still applies
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos, response=response) from e
 
 # Functions for API interaction
 def analyze_repository(repo_url):
@@ -148,17 +271,18 @@ def analyze_repository(repo_url):
         logger.info(f"Analyzing repository: {repo_url}")
         payload = {"repo_url": repo_url}
         
-        response = requests.post(
+        response = SESSION.post(
             REPO_STRUCTURE_URL,
-            json=payload,
+            data=orjson.dumps(payload),
+            headers=JSON_CONTENT_TYPE,
             timeout=30
         )
         
-        log_api_request("POST", REPO_STRUCTURE_URL, payload, response)
+        response_data = _parse(response) if response.ok else None
+        log_api_request("POST", REPO_STRUCTURE_URL, payload, response, parsed=response_data)
         
         # Check response status
         if response.ok:
-            response_data = response.json()
             job_id = response_data.get("job_id")
             logger.info(f"Successfully created job with ID: {job_id}")
             return job_id
@@ -179,12 +303,13 @@ def check_repo_status(job_id):
         url = f"{API_BASE_URL}/repositories/structure/{job_id}"
         logger.info(f"Checking status for job: {job_id} at URL: {url}")
         
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         
-        log_api_request("GET", url, response=response)
+        data = _parse(response) if response.ok else None
+        log_api_request("GET", url, response=response, parsed=data)
         
         if response.ok:
-            return response.json()
+            return data
         else:
             logger.error(f"Error response: {response.status_code} - {response.text}")
             return {"status": "failed", "error": f"{response.status_code}: {response.text}"}
@@ -194,59 +319,193 @@ def check_repo_status(job_id):
         logger.error(f"Request error: {str(e)}")
         return {"status": "failed", "error": str(e)}
 
+def _progress_marker(status_response):
+    """Summarize the parts of a status response that change as the backend makes progress"""
+    return tuple(status_response.get(key) for key in ("status",) + STATUS_PROGRESS_KEYS)
+
+def poll_until_done(job_id, initial=POLL_INITIAL_INTERVAL, factor=POLL_BACKOFF_FACTOR,
+                    cap=POLL_MAX_INTERVAL, deadline=POLL_DEADLINE, on_update=None):
+    """Poll repository status with adaptive backoff until it completes, fails or the deadline passes.
+    Returns the last status response and the number of attempts made."""
+    interval = initial
+    started = time.monotonic()
+    last_progress = None
+    status_response = {"status": "pending"}
+    attempts = 0
+
+    while time.monotonic() - started < deadline:
+        attempts += 1
+        status_response = check_repo_status(job_id)
+        if on_update:
+            on_update(status_response, attempts)
+
+        if status_response.get("status") in ["completed", "failed"]:
+            break
+
+        # Poll quickly again whenever the backend reports progress, otherwise slow down
+        progress = _progress_marker(status_response)
+        if progress != last_progress:
+            interval = initial
+            last_progress = progress
+
+        time.sleep(interval)
+        interval = min(interval * factor, cap)
+
+    return status_response, attempts
+
+# Directory listings and sizes are cached per (job_id, path) so reruns don't re-hit the API.
+# Failed requests raise instead of returning, so errors are never cached.
+def _request_explore(job_id, path=""):
+    payload = {"job_id": job_id, "path": path}
+    logger.info(f"Exploring directory: job_id={job_id}, path={path}")
+    
+    response = SESSION.post(
+        DIRECTORY_EXPLORE_URL,
+        data=orjson.dumps(payload),
+        headers=JSON_CONTENT_TYPE,
+        timeout=10
+    )
+    
+    data = _parse(response) if response.ok else None
+    log_api_request("POST", DIRECTORY_EXPLORE_URL, payload, response, parsed=data)
+    response.raise_for_status()
+    return data
+
+# A completed job's listings never change, so they are kept for an hour
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _fetch_explore(job_id, path=""):
+    return _request_explore(job_id, path)
+
+def _dir_sizes_frame(directories):
+    """Build the directory statistics table from a directory-sizes response"""
+    df = pd.DataFrame(directories, columns=["name", "total_files", "code_files", "subdirectories"]).rename(columns={
+        "name": "Directory",
+        "total_files": "Total Files",
+        "code_files": "Code Files",
+        "subdirectories": "Subdirectories"
+    })
+    counts = ["Total Files", "Code Files", "Subdirectories"]
+    df[counts] = df[counts].fillna(0).astype(int)
+    df.insert(3, "Other Files", df["Total Files"] - df["Code Files"])
+    return df
+
+# The statistics table is built inside the same cache entry as the response, so the two never disagree
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_dir_sizes(job_id, path=""):
+    payload = {"job_id": job_id, "path": path}
+    
+    response = SESSION.post(
+        DIRECTORY_SIZES_URL,
+        data=orjson.dumps(payload),
+        headers=JSON_CONTENT_TYPE,
+        timeout=10
+    )
+    
+    data = _parse(response) if response.ok else None
+    log_api_request("POST", DIRECTORY_SIZES_URL, payload, response, parsed=data)
+    response.raise_for_status()
+    return data, _dir_sizes_frame(data.get("directories", []))
+
 def explore_directory(job_id, path=""):
     """Get directory contents"""
     try:
-        payload = {"job_id": job_id, "path": path}
-        logger.info(f"Exploring directory: job_id={job_id}, path={path}")
-        
-        response = requests.post(
-            DIRECTORY_EXPLORE_URL,
-            json=payload,
-            timeout=10
-        )
-        
-        log_api_request("POST", DIRECTORY_EXPLORE_URL, payload, response)
-        
-        if response.ok:
-            return response.json()
-        else:
-            logger.error(f"Error response: {response.status_code} - {response.text}")
-            st.error(f"Error exploring directory: {response.status_code} - {response.text}")
-            return None
-            
+        # Listings of a job that is still processing may be incomplete, so only cache completed ones
+        if st.session_state.repo_status == "completed":
+            return _fetch_explore(job_id, path)
+        return _request_explore(job_id, path)
+        
+    except requests.exceptions.HTTPError as e:
+        response = e.response
+        logger.error(f"Error response: {response.status_code} - {response.text}")
+        st.error(f"Error exploring directory: {response.status_code} - {response.text}")
+        return None
     except requests.exceptions.RequestException as e:
-        log_api_request("POST", DIRECTORY_EXPLORE_URL, payload, error=e)
+        log_api_request("POST", DIRECTORY_EXPLORE_URL, {"job_id": job_id, "path": path}, error=e)
         logger.error(f"Request error: {str(e)}")
         st.error(f"Error exploring directory: {str(e)}")
         return None
 
 def get_directory_sizes(job_id, path=""):
-    """Get directory sizes"""
+    """Get directory sizes and the statistics table built from them"""
     try:
-        payload = {"job_id": job_id, "path": path}
-        
-        response = requests.post(
-            DIRECTORY_SIZES_URL,
-            json=payload,
-            timeout=10
-        )
+        return _fetch_dir_sizes(job_id, path)
         
-        log_api_request("POST", DIRECTORY_SIZES_URL, payload, response)
-        
-        if response.ok:
-            return response.json()
-        else:
-            logger.error(f"Error response: {response.status_code} - {response.text}")
-            st.error(f"Error getting directory sizes: {response.status_code} - {response.text}")
-            return None
-            
+    except requests.exceptions.HTTPError as e:
+        response = e.response
+        logger.error(f"Error response: {response.status_code} - {response.text}")
+        st.error(f"Error getting directory sizes: {response.status_code} - {response.text}")
+        return None
     except requests.exceptions.RequestException as e:
-        log_api_request("POST", DIRECTORY_SIZES_URL, payload, error=e)
+        log_api_request("POST", DIRECTORY_SIZES_URL, {"job_id": job_id, "path": path}, error=e)
         logger.error(f"Request error: {str(e)}")
         st.error(f"Error getting directory sizes: {str(e)}")
         return None
 
+@st.cache_data(ttl=300, show_spinner=False)
+def build_dir_fig(df_records):
+    """Build the directory size bar chart and return it as Plotly JSON"""
+    df = pd.DataFrame(df_records)
+    fig = px.bar(
+        df, 
+        x="Directory", 
+        y=["Code Files", "Other Files"],
+        title="Top 10 Directories by Size",
+        labels={"value": "Number of Files", "variable": "File Type"},
+        color_discrete_map={"Code Files": "#1f77b4", "Other Files": "#aec7e8"}
+    )
+    return fig.to_json()
+
+def directory_listing_frame(contents):
+    """Build the File Explorer table: directories first, then files"""
+    dirs = pd.DataFrame(contents.get("directories") or [], columns=["name", "path", "file_count"])
+    files = pd.DataFrame(contents.get("files") or [], columns=["name", "extension", "size"])
+    
+    sizes = files["size"].fillna(0).astype(int)
+    size_str = np.where(
+        sizes >= 1024,
+        (sizes / 1024).round(1).astype(str) + " KB",
+        sizes.astype(str) + " bytes"
+    )
+    
+    return pd.concat([
+        pd.DataFrame({
+            "Name": "📁 " + dirs["name"].fillna(""),
+            "Type": "directory",
+            "Size": dirs["file_count"].fillna(0).astype(int).astype(str) + " files",
+            "path": dirs["path"],
+            "is_dir": True
+        }),
+        pd.DataFrame({
+            "Name": "📄 " + files["name"].fillna(""),
+            "Type": files["extension"].fillna("").str.lower().replace("", "other"),
+            "Size": size_str,
+            "path": None,
+            "is_dir": False
+        })
+    ], ignore_index=True)
+
+def prefetch(fetch, *args):
+    """Warm one of the cached fetchers on the worker pool; errors are left for the caller to surface"""
+    ctx = get_script_run_ctx()
+    sink = st.session_state.worker_logs
+    debug_mode = st.session_state.debug_mode
+    
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        _worker_log.sink = sink
+        _worker_log.debug_mode = debug_mode
+        try:
+            fetch(*args)
+        except requests.exceptions.RequestException:
+            pass
+    
+    return EXECUTOR.submit(run)
+
+def fetch_overview(job_id):
+    """Get the root directory contents of a completed job, warming the directory sizes cache in the background"""
+    prefetch(_fetch_dir_sizes, job_id, "")
+    return explore_directory(job_id)
+
 def auto_roast_repository(job_id, style="brutal", file_count=2, extensions=None, 
                          directories=None, description=None, suggestions="none"):
     """Auto-roast selected files from repository"""
@@ -269,16 +528,18 @@ def auto_roast_repository(job_id, style="brutal", file_count=2, extensions=None,
             
         logger.info(f"Auto-roasting repository: {payload}")
         
-        response = requests.post(
+        response = SESSION.post(
             AUTO_ROAST_URL,
-            json=payload,
+            data=orjson.dumps(payload),
+            headers=JSON_CONTENT_TYPE,
             timeout=300  # Longer timeout for LLM processing
         )
         
-        log_api_request("POST", AUTO_ROAST_URL, payload, response)
+        data = _parse(response) if response.ok else None
+        log_api_request("POST", AUTO_ROAST_URL, payload, response, parsed=data)
         
         if response.ok:
-            return response.json()
+            return data
         else:
             logger.error(f"Error response: {response.status_code} - {response.text}")
             st.error(f"Error roasting repository: {response.status_code} - {response.text}")
@@ -295,12 +556,13 @@ def check_roast_results(job_id):
     try:
         url = f"{API_BASE_URL}/repositories/auto-roast/{job_id}"
         
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         
-        log_api_request("GET", url, response=response)
+        data = _parse(response) if response.ok else None
+        log_api_request("GET", url, response=response, parsed=data)
         
         if response.ok:
-            return response.json()
+            return data
         else:
             logger.error(f"Error response: {response.status_code} - {response.text}")
             st.error(f"Error checking roast results: {response.status_code} - {response.text}")
@@ -312,6 +574,16 @@ def check_roast_results(job_id):
         st.error(f"Error checking roast results: {str(e)}")
         return None
 
+# Handle breadcrumb navigation before the sidebar and tabs are built, so this run already shows the root
+if 'root' in st.session_state:
+    del st.session_state['root']
+    if st.session_state.current_path:
+        st.session_state.current_path = ""
+        st.session_state.directory_contents = explore_directory(
+            st.session_state.job_id, 
+            ""
+        )
+
 # Sidebar for repository input
 with st.sidebar:
     st.header("Repository")
@@ -322,6 +594,7 @@ with st.sidebar:
         if repo_url:
             with st.spinner("Analyzing repository... This may take a moment"):
                 st.session_state.repo_url = repo_url
+                st.session_state.prefetched_listing = None
                 
                 # First attempt to create a job
                 job_id = analyze_repository(repo_url)
@@ -331,39 +604,35 @@ with st.sidebar:
                     st.session_state.job_id = job_id
                     st.session_state.repo_status = "pending"
                     
-                    # Wait a significant amount of time before checking status
-                    # This gives the backend time to fully process the job
-                    time.sleep(8)  # Increased from previous values
-                    
-                    # Retry mechanism for checking status with exponential backoff
-                    retry_count = 0
-                    max_retries = 4
+                    # Confirm the job is registered, polling quickly at first and backing off
+                    # on failures instead of waiting a fixed amount of time up front
+                    status_url = f"{API_BASE_URL}/repositories/structure/{job_id}"
+                    attempt_placeholder = st.empty()
+                    interval = POLL_INITIAL_INTERVAL
+                    registration_deadline = time.monotonic() + REGISTRATION_DEADLINE
+                    attempt = 0
                     success = False
                     
-                    while retry_count < max_retries and not success:
+                    while not success and time.monotonic() < registration_deadline:
                         try:
-                            retry_count += 1
-                            status_url = f"{API_BASE_URL}/repositories/structure/{job_id}"
+                            attempt += 1
+                            attempt_placeholder.info(f"Checking job status (attempt {attempt})...")
                             
-                            st.info(f"Checking job status (attempt {retry_count}/{max_retries})...")
-                            
-                            initial_status_response = requests.get(status_url, timeout=15)
+                            initial_status_response = SESSION.get(status_url, timeout=15)
                             
                             if initial_status_response.ok:
-                                initial_status = initial_status_response.json()
+                                initial_status = _parse(initial_status_response)
                                 st.session_state.repo_status = initial_status.get("status", "pending")
                                 success = True
                                 st.session_state.directory_contents = explore_directory(st.session_state.job_id)
                                 st.success("Repository status check successful")
-                                st.rerun()
                             else:
-                                wait_time = 2 ** retry_count  # Exponential backoff
-                                st.warning(f"Status check failed. Retrying in {wait_time} seconds...")
-                                time.sleep(wait_time)
+                                attempt_placeholder.warning(f"Status check failed. Retrying in {interval:.1f} seconds...")
+                                time.sleep(interval)
                         except Exception as e:
-                            wait_time = 2 ** retry_count
-                            st.warning(f"Error checking status: {str(e)}. Retrying in {wait_time} seconds...")
-                            time.sleep(wait_time)
+                            attempt_placeholder.warning(f"Error checking status: {str(e)}. Retrying in {interval:.1f} seconds...")
+                            time.sleep(interval)
+                        interval = min(interval * POLL_BACKOFF_FACTOR, POLL_MAX_INTERVAL)
                     
                     if not success:
                         st.error("Failed to verify job status after multiple attempts. Try clicking Analyze Repository again.")
@@ -375,55 +644,36 @@ with st.sidebar:
     # Display repository status
     if st.session_state.job_id and st.session_state.repo_status:
         st.subheader("Repository Status")
-        status_placeholder = st.empty()
-        
-        if st.session_state.repo_status != "completed":
-            # Use the status_placeholder to show status updates
-            polling_count = 0
-            max_polling_attempts = 30  # Prevent infinite loops
+        if st.session_state.repo_status == "completed":
+            st.success("Repository processed successfully!")
+        elif st.session_state.repo_status != "failed":
+            status_placeholder = st.empty()
             
-            while (st.session_state.repo_status not in ["completed", "failed"] 
-                  and polling_count < max_polling_attempts):
-                
-                polling_count += 1
-                
+            # Use the status_placeholder to show status updates
+            def show_status(status_response, attempt):
                 with status_placeholder:
-                    st.info(f"Status: {st.session_state.repo_status} (Polling attempt: {polling_count})")
-                    
-                status_response = check_repo_status(st.session_state.job_id)
-                
-                if status_response:
-                    st.session_state.repo_status = status_response.get("status")
-                    
-                    if st.session_state.debug_mode:
-                        st.write("Status Response:")
-                        st.json(status_response)
-                    
-                    if st.session_state.repo_status == "completed":
-                        with status_placeholder:
-                            st.success("Repository processed successfully!")
-                        st.session_state.directory_contents = explore_directory(st.session_state.job_id)
-                        st.rerun()
-                    elif st.session_state.repo_status == "failed":
-                        with status_placeholder:
-                            st.error(f"Failed: {status_response.get('error', 'Unknown error')}")
-                else:
-                    with status_placeholder:
-                        st.error("Failed to check repository status. See logs for details.")
-                    break
+                    st.info(f"Status: {status_response.get('status')} (Polling attempt: {attempt})")
                 
-                # Sleep for 2 seconds before next polling
-                time.sleep(2)
-                
-            # If we've reached max polling attempts
-            if polling_count >= max_polling_attempts and st.session_state.repo_status != "completed":
+                if st.session_state.debug_mode:
+                    st.write("Status Response:")
+                    st.json(status_response)
+            
+            status_response, polling_count = poll_until_done(st.session_state.job_id, on_update=show_status)
+            st.session_state.repo_status = status_response.get("status")
+            
+            if st.session_state.repo_status == "completed":
+                # The rest of this run already sees the completed status, so no rerun is needed
+                status_placeholder.success("Repository processed successfully!")
+                st.session_state.directory_contents = fetch_overview(st.session_state.job_id)
+            elif st.session_state.repo_status == "failed":
+                with status_placeholder:
+                    st.error(f"Failed: {status_response.get('error', 'Unknown error')}")
+            else:
+                # Deadline reached while the job is still running
                 with status_placeholder:
-                    st.warning(f"Reached maximum polling attempts ({max_polling_attempts}). Status: {st.session_state.repo_status}")
+                    st.warning(f"Stopped polling after {polling_count} attempts. Status: {st.session_state.repo_status}")
                     if st.button("Retry Status Check"):
                         st.rerun()
-        else:
-            with status_placeholder:
-                st.success("Repository processed successfully!")
     
     # Auto-Roast Configuration (only shown when repo is ready)
     if st.session_state.repo_status == "completed":
@@ -445,25 +695,15 @@ with st.sidebar:
         
         # Extension selection
         with st.expander("File Extensions"):
-            py_files = st.checkbox("Python (.py)", value=True)
-            js_files = st.checkbox("JavaScript (.js, .jsx)")
-            ts_files = st.checkbox("TypeScript (.ts, .tsx)")
-            java_files = st.checkbox("Java (.java)")
+            # Build extensions list from the selected language checkboxes
+            extensions = list(chain.from_iterable(
+                exts for label, (exts, default) in EXTENSION_OPTIONS.items()
+                if st.checkbox(label, value=default)
+            ))
             other_ext = st.text_input("Other extensions (comma separated)", 
                                     placeholder="e.g. .rb,.go,.php")
-            
-            # Build extensions list
-            extensions = []
-            if py_files:
-                extensions.append(".py")
-            if js_files:
-                extensions.extend([".js", ".jsx"])
-            if ts_files:
-                extensions.extend([".ts", ".tsx"])
-            if java_files:
-                extensions.append(".java")
             if other_ext:
-                extensions.extend([ext.strip() for ext in other_ext.split(",") if ext.strip()])
+                extensions.extend(ext for ext in map(str.strip, other_ext.split(",")) if ext)
         
         # Additional options
         description = st.text_area("Focus Description", 
@@ -490,6 +730,8 @@ with st.sidebar:
                 else:
                     st.error("Failed to roast code. Check the logs for details.")
 
+merge_worker_logs()
+
 # Debug logs section
 if st.session_state.debug_mode:
     st.header("Debug Information")
@@ -499,51 +741,148 @@ if st.session_state.debug_mode:
     # Display request logs
     st.subheader("API Request Logs")
     if st.session_state.request_logs:
-        for log in reversed(st.session_state.request_logs):
-            log_class = "log-entry"
-            if log.get('error') or (log.get('status_code') and log.get('status_code') >= 400):
-                log_class += " log-error"
-                
-            st.markdown(f"""
-            <div class="{log_class}">
-                <strong>{log['timestamp']}</strong> - {log['method']} {log['url']}<br/>
-                Status Code: {log['status_code'] or 'N/A'}
-            </div>
-            """, unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2)
+        # Render every entry into one HTML blob so the whole log is a single element
+        logs = list(st.session_state.request_logs)
+        st.markdown("\n".join(render_log_entry(log) for log in reversed(logs)),
+                    unsafe_allow_html=True)
+    else:
+        st.write("No logs recorded yet")
+
+def open_directory(path):
+    """Widget callback that moves the File Explorer to another directory"""
+    st.session_state.explorer_nav += 1
+    st.session_state.current_path = path
+    # Cleared so the explorer loads the new listing when it renders
+    st.session_state.directory_contents = None
+
+def open_selected_directory(listing, key):
+    """Selection callback that opens the directory picked in the listing table"""
+    selected = st.session_state[key].selection.rows
+    if selected and listing.iloc[selected[0]]["is_dir"]:
+        open_directory(listing.iloc[selected[0]]["path"])
+
+# Tab bodies with their own widgets run as fragments, so interacting with them
+# reruns only that tab instead of the whole script
+@st.fragment
+def render_file_explorer():
+    """Render the File Explorer tab for the analyzed repository"""
+    st.header("File Explorer")
+    
+    # Breadcrumb navigation
+    if st.session_state.current_path:
+        path_parts = st.session_state.current_path.split('/')
+        crumbs = ["[root](exec:set_path:)"]
+        prefix = ""
+        for part in path_parts[:-1]:
+            prefix = f"{prefix}/{part}" if prefix else part
+            crumbs.append(f"[{part}](exec:set_path:{prefix})")
+        crumbs.append(f"[{path_parts[-1]}](.)")
+        breadcrumb = " / ".join(crumbs)
+        
+        # Add Back button when in a subdirectory
+        parent_path = '/'.join(path_parts[:-1]) if len(path_parts) > 1 else ""
+        st.button("⬅️ Back to parent directory", on_click=open_directory, args=(parent_path,))
+    else:
+        breadcrumb = "[root](.)"
+        
+    st.markdown(breadcrumb)
+    
+    # Get directory contents
+    if st.session_state.directory_contents is None:
+        st.session_state.directory_contents = explore_directory(
+            st.session_state.job_id, 
+            st.session_state.current_path
+        )
+    
+    if st.session_state.directory_contents:
+        listing = directory_listing_frame(st.session_state.directory_contents)
+        
+        if listing.empty:
+            st.info("This directory is empty.")
+        else:
+            # Selecting a directory row opens it; the key changes on every navigation
+            # so the new listing starts without a selection
+            key = f"explorer_{st.session_state.explorer_nav}"
+            st.dataframe(
+                listing,
+                column_order=["Name", "Type", "Size"],
+                hide_index=True,
+                use_container_width=True,
+                on_select=partial(open_selected_directory, listing, key),
+                selection_mode="single-row",
+                key=key
+            )
             
-            with col1:
-                if log['payload']:
-                    st.write("Request Payload:")
-                    st.json(log['payload'])
+            # Load subdirectory listings in the background so drilling down hits the cache,
+            # once per listing rather than on every rerun
+            listing_key = (st.session_state.job_id, st.session_state.current_path)
+            if st.session_state.repo_status == "completed" and st.session_state.prefetched_listing != listing_key:
+                st.session_state.prefetched_listing = listing_key
+                for path in listing.loc[listing["is_dir"], "path"].dropna().head(MAX_PREFETCHED_PATHS):
+                    prefetch(_fetch_explore, st.session_state.job_id, path)
+    else:
+        st.warning("Could not load directory contents.")
+
+@st.fragment
+def render_roast_results():
+    """Render the Roast Results tab"""
+    if st.session_state.roast_status == "completed" and st.session_state.roast_results:
+        st.header("Code Critique Results")
+        
+        results = st.session_state.roast_results
+        style = results.get("parameters", {}).get("style", "brutal")
+        
+        # Display summary if available
+        if "summary" in results:
+            st.subheader("Repository-Wide Issues")
+            with st.container(border=True):
+                st.markdown(results["summary"])
+        
+        # Display file critiques
+        st.subheader("File Critiques")
+        
+        for file_data in results.get("roasted_files", []):
+            if len(file_data) >= 2:  # Ensure we have at least the file path and critique
+                file_path = file_data[0]
+                critique = file_data[1]
                 
-            with col2:
-                if log['response']:
-                    st.write("Response:")
-                    st.json(log['response'])
-                elif log['response_text']:
-                    st.write("Response Text:")
-                    st.code(log['response_text'])
+                with st.expander(f"📄 {file_path}", expanded=True):
+                    # Display the critique
+                    with st.container(border=True):
+                        st.markdown(f"#### :{STYLE_COLORS.get(style, 'gray')}[Critique ({style.capitalize()} Style)]")
+                        st.markdown(critique)
                     
-            if log['error']:
-                st.error(log['error'])
-                
-            st.markdown("---")
+                    # Display suggestions if available
+                    if len(file_data) >= 3:
+                        suggestions = file_data[2]
+                        with st.container(border=True):
+                            st.markdown("#### :green[Improvement Suggestions]")
+                            st.markdown(suggestions)
     else:
-        st.write("No logs recorded yet")
+        st.info("Configure and run Auto-Roast to see results here.")
 
 # Main content area with tabs
-tab1, tab2, tab3 = st.tabs(["Repository Info", "File Explorer", "Roast Results"])
+# The active tab is chosen server-side and kept in the URL, so only its body is rendered
+st.radio("View", options=range(len(TABS)), format_func=lambda i: TABS[i], key="active_tab",
+         horizontal=True, label_visibility="collapsed")
+if st.query_params.get("tab") != str(st.session_state.active_tab):
+    # Only touch the URL when the tab actually changes
+    st.query_params["tab"] = str(st.session_state.active_tab)
 
-with tab1:
+if st.session_state.active_tab == 0:
     if st.session_state.repo_status == "completed":
         st.header(f"Repository: {st.session_state.repo_url.split('/')[-1]}")
         
+        # Start loading the File Explorer listing while this tab renders
+        if st.session_state.directory_contents is None:
+            prefetch(_fetch_explore, st.session_state.job_id, st.session_state.current_path)
+        
         # Get directory sizes for visualization
-        dir_sizes = get_directory_sizes(st.session_state.job_id)
+        sizes = get_directory_sizes(st.session_state.job_id)
         
-        if dir_sizes and "directories" in dir_sizes:
+        if sizes and "directories" in sizes[0]:
+            dir_sizes, df = sizes
+            
             # Create two columns for stats and visualization
             col1, col2 = st.columns([1, 2])
             
@@ -553,49 +892,27 @@ with tab1:
                 st.metric("Total Directories", dir_sizes.get("total_count", 0))
                 
                 # Total files
-                total_files = sum(d.get("total_files", 0) for d in dir_sizes.get("directories", []))
-                st.metric("Total Files", total_files)
+                st.metric("Total Files", int(df["Total Files"].sum()))
                 
                 # Code files
-                total_code = sum(d.get("code_files", 0) for d in dir_sizes.get("directories", []))
-                st.metric("Code Files", total_code)
+                st.metric("Code Files", int(df["Code Files"].sum()))
                 
                 # Largest directory
-                if dir_sizes.get("directories"):
-                    largest_dir = max(dir_sizes.get("directories", []), 
-                                    key=lambda x: x.get("total_files", 0))
+                if not df.empty:
+                    largest_dir = df.loc[df["Total Files"].idxmax()]
                     st.metric("Largest Directory", 
-                            largest_dir.get("name"), 
-                            f"{largest_dir.get('total_files', 0)} files")
+                            largest_dir["Directory"], 
+                            f"{largest_dir['Total Files']} files")
             
             with col2:
                 st.subheader("Directory Size Distribution")
                 
-                # Create DataFrame for visualization
-                df = pd.DataFrame([
-                    {
-                        "Directory": d.get("name"),
-                        "Total Files": d.get("total_files", 0),
-                        "Code Files": d.get("code_files", 0),
-                        "Other Files": d.get("total_files", 0) - d.get("code_files", 0),
-                        "Subdirectories": d.get("subdirectories", 0)
-                    }
-                    for d in dir_sizes.get("directories", [])
-                ])
-                
                 if not df.empty:
-                    # Sort by total files
-                    df = df.sort_values("Total Files", ascending=False).head(10)
+                    # Top 10 by total files
+                    df = df.nlargest(10, "Total Files")
                     
                     # Create bar chart
-                    fig = px.bar(
-                        df, 
-                        x="Directory", 
-                        y=["Code Files", "Other Files"],
-                        title="Top 10 Directories by Size",
-                        labels={"value": "Number of Files", "variable": "File Type"},
-                        color_discrete_map={"Code Files": "#1f77b4", "Other Files": "#aec7e8"}
-                    )
+                    fig = pio.from_json(build_dir_fig(df.to_dict("records")))
                     st.plotly_chart(fig, use_container_width=True)
                     
                     # Create a table view
@@ -605,160 +922,11 @@ with tab1:
     else:
         st.info("Enter a GitHub repository URL and click 'Analyze Repository' to get started.")
 
-with tab2:
+elif st.session_state.active_tab == 1:
     if st.session_state.repo_status == "completed":
-        st.header("File Explorer")
-        
-        # Breadcrumb navigation
-        if st.session_state.current_path:
-            path_parts = st.session_state.current_path.split('/')
-            breadcrumb = " / ".join([
-                f"[{part}](.)" if i == len(path_parts)-1 
-                else f"[{part}](exec:set_path:{'/'.join(path_parts[:i+1])})"
-                for i, part in enumerate(path_parts)
-            ])
-            breadcrumb = f"[root](exec:set_path:) / {breadcrumb}"
-            
-            # Add Back button when in a subdirectory
-            parent_path = '/'.join(path_parts[:-1]) if len(path_parts) > 1 else ""
-            if st.button("⬅️ Back to parent directory"):
-                st.session_state.current_path = parent_path
-                st.session_state.directory_contents = explore_directory(
-                    st.session_state.job_id, 
-                    parent_path
-                )
-                st.rerun()
-        else:
-            breadcrumb = "[root](.)"
-            
-        st.markdown(breadcrumb)
-        
-        # Get directory contents
-        if st.session_state.directory_contents is None:
-            st.session_state.directory_contents = explore_directory(
-                st.session_state.job_id, 
-                st.session_state.current_path
-            )
-        
-        if st.session_state.directory_contents:
-            contents = st.session_state.directory_contents
-            
-            # Display directories
-            if contents.get("directories"):
-                st.subheader("Directories")
-                for directory in contents.get("directories", []):
-                    dir_name = directory.get("name")
-                    file_count = directory.get("file_count", 0)
-                    path = directory.get("path")
-                    
-                    if st.button(f"📁 {dir_name} ({file_count} files)", key=f"dir_{path}"):
-                        st.session_state.current_path = path
-                        st.session_state.directory_contents = explore_directory(
-                            st.session_state.job_id, 
-                            path
-                        )
-                        st.rerun()
-            
-            # Display files
-            if contents.get("files"):
-                st.subheader("Files")
-                # Group files by extension
-                files_by_ext = {}
-                for file in contents.get("files", []):
-                    ext = file.get("extension", "").lower() or "other"
-                    if ext not in files_by_ext:
-                        files_by_ext[ext] = []
-                    files_by_ext[ext].append(file)
-                
-                # Display files by extension group
-                for ext, files in files_by_ext.items():
-                    with st.expander(f"{ext} files ({len(files)})"):
-                        for file in files:
-                            file_name = file.get("name")
-                            file_size = file.get("size", 0)
-                            size_str = f"{file_size / 1024:.1f} KB" if file_size >= 1024 else f"{file_size} bytes"
-                            st.text(f"📄 {file_name} ({size_str})")
-            
-            if not contents.get("directories") and not contents.get("files"):
-                st.info("This directory is empty.")
-        else:
-            st.warning("Could not load directory contents.")
+        render_file_explorer()
     else:
         st.info("Enter a GitHub repository URL and click 'Analyze Repository' to explore files.")
 
-with tab3:
-    if st.session_state.roast_status == "completed" and st.session_state.roast_results:
-        st.header("Code Critique Results")
-        
-        results = st.session_state.roast_results
-        style = results.get("parameters", {}).get("style", "brutal")
-        
-        # Display summary if available
-        if "summary" in results:
-            st.subheader("Repository-Wide Issues")
-            st.markdown(f"""
-            <div class="summary-box {style}" style="color: #333;">
-                {results["summary"]}
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Display file critiques
-        st.subheader("File Critiques")
-        
-        for file_data in results.get("roasted_files", []):
-            if len(file_data) >= 2:  # Ensure we have at least the file path and critique
-                file_path = file_data[0]
-                critique = file_data[1]
-                
-                with st.expander(f"📄 {file_path}", expanded=True):
-                    # Display the critique
-                    st.markdown(f"""
-                    <div class="critique-box {style}" style="color: #333;">
-                        <h4>Critique ({style.capitalize()} Style)</h4>
-                        {critique}
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Display suggestions if available
-                    if len(file_data) >= 3:
-                        suggestions = file_data[2]
-                        st.markdown(f"""
-                        <div class="suggestion-box">
-                            <h4>Improvement Suggestions</h4>
-                            {suggestions}
-                        </div>
-                        """, unsafe_allow_html=True)
-    else:
-        st.info("Configure and run Auto-Roast to see results here.")
-
-# Handle breadcrumb navigation
-if 'root' in st.session_state and st.session_state.current_path:
-    st.session_state.current_path = ""
-    st.session_state.directory_contents = explore_directory(
-        st.session_state.job_id, 
-        ""
-    )
-    st.rerun()
-
-# Set the active tab based on session state
-# This has to be at the end because streamlit doesn't support direct tab switching
-if st.session_state.active_tab == 0:
-    pass  # Already on Repository Info tab
-elif st.session_state.active_tab == 1:
-    # JavaScript to click the "File Explorer" tab
-    js = f"""
-    <script>
-        var tabs = window.parent.document.querySelectorAll('button[data-baseweb="tab"]');
-        tabs[1].click();
-    </script>
-    """
-    st.components.v1.html(js, height=0)
 elif st.session_state.active_tab == 2:
-    # JavaScript to click the "Roast Results" tab
-    js = f"""
-    <script>
-        var tabs = window.parent.document.querySelectorAll('button[data-baseweb="tab"]');
-        tabs[2].click();
-    </script>
-    """
-    st.components.v1.html(js, height=0)
+    render_roast_results()